@@ -7,84 +7,90 @@ Clean up monster HTML files by removing non-stat-block elements:
 - <div class="tags"> (tag divs)
 """
 
+import multiprocessing
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment
 import re
 
 OUTPUT_DIR = Path('foundation/monsters-bfrd')
+REMOVED_DIV_CLASSES = {'source-url', 'breadcrumb', 'tags'}
+BOTTOMAD_RE = re.compile('bottomad', re.I)
+EZOIC_RE = re.compile('ezoic', re.I)
+# .source-url { ... } as well as descendant rules like .source-url a:hover { ... }
+SOURCE_URL_CSS_RE = re.compile(r'\.source-url(?:\s+[^{]*)?\s*\{[^}]*\}')
+
+# Everything clean_monster_html removes leaves one of these in the lowercased
+# raw bytes, so files without any of them are already clean
+CLEANUP_MARKERS = (b'source-url', b'breadcrumb', b'tags', b'bottomad', b'ezoic', b'adsbygoogle')
+AD_COMMENT_RE = re.compile(rb'<!--(?:(?!-->).)*?(?:ad|ezoic)', re.S)
+
+def needs_cleaning(content: bytes) -> bool:
+    """Cheap byte-level check whether a file has anything left to clean"""
+    lowered = content.lower()
+    return any(marker in lowered for marker in CLEANUP_MARKERS) or bool(AD_COMMENT_RE.search(lowered))
+
+def is_removable(element):
+    """Whether a div/ins element is page chrome or an ad that should be dropped"""
+    classes = element.get('class', [])
+    if element.name == 'ins':
+        return 'adsbygoogle' in classes
+    return (
+        any(c in REMOVED_DIV_CLASSES or BOTTOMAD_RE.search(c) for c in classes)
+        or bool(EZOIC_RE.search(element.get('id', '')))
+    )
 
 def clean_monster_html(filepath):
     """Clean a single monster HTML file"""
     print(f"Cleaning {filepath.name}...")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    soup = BeautifulSoup(content, 'html.parser')
-    
-    # Remove source-url divs
-    source_urls = soup.find_all('div', class_='source-url')
-    for div in source_urls:
-        div.decompose()
-    
-    # Remove breadcrumb divs
-    breadcrumbs = soup.find_all('div', class_='breadcrumb')
-    for div in breadcrumbs:
-        div.decompose()
-    
-    # Remove tags divs
-    tags_divs = soup.find_all('div', class_='tags')
-    for div in tags_divs:
-        div.decompose()
+    # Hand lxml the raw bytes rather than decoding to str first
+    content = filepath.read_bytes()
     
-    # Remove bottomad (advertisement) divs
-    bottomads = soup.find_all('div', class_='bottomad')
-    for div in bottomads:
-        div.decompose()
-    
-    # Also remove any divs with "bottomad" in class
-    bottomads_any = soup.find_all('div', class_=re.compile('bottomad', re.I))
-    for div in bottomads_any:
-        div.decompose()
-    
-    # Remove Ezoic ad placeholders
-    ezoic_ads = soup.find_all('div', id=re.compile('ezoic', re.I))
-    for div in ezoic_ads:
-        div.decompose()
-    
-    # Remove adsbygoogle ins elements
-    adsbygoogle = soup.find_all('ins', class_='adsbygoogle')
-    for ins in adsbygoogle:
-        ins.decompose()
+    # Skip the parse (and the rewrite) entirely for already-clean files
+    if not needs_cleaning(content):
+        print(f"  {filepath.name} is already clean")
+        return
     
-    # Remove comment blocks that mention ads
-    from bs4 import Comment
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        if 'ad' in comment.lower() or 'ezoic' in comment.lower():
+    soup = BeautifulSoup(content, 'lxml', from_encoding='utf-8')
+    
+    # Remove source-url, breadcrumb, tags, bottomad (advertisement) and Ezoic
+    # placeholder divs plus adsbygoogle ins elements in a single tree walk
+    for element in soup.find_all(['div', 'ins']):
+        # Already removed along with an ancestor
+        if element.decomposed:
+            continue
+        if is_removable(element):
+            element.decompose()
+    
+    # Remove comment blocks that mention ads. Walking descendants is much
+    # cheaper than find_all(string=<filter>); find_all(string=Comment) doesn't
+    # work, bs4 calls the class as a filter and matches every string.
+    comments = [node for node in soup.descendants if isinstance(node, Comment)]
+    for comment in comments:
+        text = comment.lower()
+        if 'ad' in text or 'ezoic' in text:
             comment.extract()
     
-    # Clean up empty divs that might be left behind
-    empty_divs = soup.find_all('div', class_='bottomad left')
-    for div in empty_divs:
-        div.decompose()
-    
     # Remove CSS for source-url since we removed those elements
     style_tag = soup.find('style')
     if style_tag:
         # Remove source-url CSS rules
         style_content = style_tag.string
-        if style_content:
-            # Remove .source-url CSS block
-            style_content = re.sub(r'\.source-url\s*\{[^}]*\}', '', style_content)
-            style_content = re.sub(r'\.source-url\s+[^{]*\{[^}]*\}', '', style_content)
-            style_tag.string = style_content
+        if style_content and '.source-url' in style_content:
+            style_tag.string = SOURCE_URL_CSS_RE.sub('', style_content)
     
     # Write cleaned content back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    filepath.write_bytes(soup.encode('utf-8'))
     
     print(f"  Cleaned {filepath.name}")
 
+def clean_monster_html_safely(filepath):
+    """Clean a single file, reporting errors instead of raising them (pool worker)"""
+    try:
+        clean_monster_html(filepath)
+    except Exception as e:
+        print(f"  Error cleaning {filepath.name}: {e}")
+
 def main():
     """Clean all monster HTML files"""
     if not OUTPUT_DIR.exists():
@@ -100,11 +106,10 @@ def main():
     print(f"Found {len(html_files)} HTML files to clean")
     print("=" * 60)
     
-    for html_file in sorted(html_files):
-        try:
-            clean_monster_html(html_file)
-        except Exception as e:
-            print(f"  Error cleaning {html_file.name}: {e}")
+    # Files are independent, so clean them in parallel across all cores
+    chunksize = max(1, len(html_files) // (4 * multiprocessing.cpu_count()))
+    with multiprocessing.Pool() as pool:
+        pool.map(clean_monster_html_safely, sorted(html_files), chunksize)
     
     print("=" * 60)
     print("Cleaning complete!")
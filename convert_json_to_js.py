@@ -6,21 +6,33 @@ Convert monsters_data.json to a JavaScript file that can be embedded
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 JSON_FILE = Path('data/monsters_data.json')
 JS_FILE = Path('data/monsters_data.js')
+JS_PREFIX = b'const monstersDataEmbedded = '
+JS_SUFFIX = b';'
 
 def main():
     print(f"Reading {JSON_FILE}...")
-    with open(JSON_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    content = JSON_FILE.read_bytes()
+    data = json.loads(content) if orjson is None else orjson.loads(content)
     
     print(f"Converting to JavaScript...")
     # Convert to JavaScript variable
-    js_content = 'const monstersDataEmbedded = ' + json.dumps(data, indent=2, ensure_ascii=False) + ';'
+    if orjson is None:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
     
     print(f"Writing to {JS_FILE}...")
-    with open(JS_FILE, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    # Write the wrapper around the payload instead of concatenating, which
+    # would hold a second full copy of a multi-MB payload in memory
+    with open(JS_FILE, 'wb') as f:
+        f.writelines((JS_PREFIX, payload, JS_SUFFIX))
     
     print(f"Done! Created {JS_FILE}")
     print(f"File size: {JS_FILE.stat().st_size / 1024 / 1024:.2f} MB")
@@ -2,16 +2,123 @@
 """
 Parse monster HTML files and convert them to ETF format.
 Extracts stat blocks and converts them to JSON for use in monsters.html
+
+Files whose content (and this script) are unchanged since the last run are
+not re-parsed; their monsters are copied from the previous output. Pass
+--force to re-parse everything.
+
+The output is written as compact JSON; pass --pretty to indent it.
 """
 
+import copy
+import hashlib
 import json
+import multiprocessing
 import re
+import sys
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 MONSTERS_DIR = Path('rules/monsters-bfrd')
 OUTPUT_FILE = Path('data/monsters_data.js')
+HASHES_FILE = Path('data/monsters_data.hashes.json')
+# One parser shared by every file. Monster files are parsed straight from
+# bytes, so don't leave the encoding to libxml2's guesswork, and lift
+# libxml2's size limits for the larger CR pages.
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', huge_tree=True)
+JS_PREFIX = b'const monstersDataEmbedded = '
+JS_SUFFIX = b';\n'
+
+def has_class(class_name: str) -> str:
+    """XPath predicate matching a single class token, like bs4's class_="""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+STAT_BLOCK_XPATH = etree.XPath(f'//div[{has_class("monster-stat-block")}]')
+TITLE_XPATH = etree.XPath(f'.//h1[{has_class("title")}]')
+CONTENT_XPATH = etree.XPath(f'.//div[{has_class("post-single-content")}]')
+ABILITY_TABLE_XPATH = etree.XPath(f'.//figure[{has_class("monster-ability-scores")}]')
+
+# Stat block field patterns
+CR_RE = re.compile(r'CR\s+[\d/]+', re.IGNORECASE)
+HP_RE = re.compile(r'Hit Points\s+(\d+)', re.IGNORECASE)
+AC_RE = re.compile(r'Armor Class\s+(\d+)', re.IGNORECASE)
+HP_VALUE_RE = re.compile(r'\s*(\d+)')
+DIGITS_RE = re.compile(r'(\d+)')
+
+# ETF HP for every realistic D&D HP value (HP/10 rounded up, minimum 1)
+HP_LOOKUP = tuple(max(1, (hp + 9) // 10) for hp in range(501))
+
+# Attack roll patterns: "Melee Weapon Attack: +X to hit" or "+X to hit"
+TO_HIT_RE = re.compile(r'(?:(?:Melee|Ranged) Weapon Attack:\s*)?\+(\d+)\s+to hit')
+
+def first_letter_gate(words) -> str:
+    """Lookahead that rejects a position unless it starts one of the words.
+
+    Most positions in a stat block can't start a replacement, so a single
+    character-class test there is far cheaper than trying each alternative.
+    """
+    return '(?=[' + ''.join(sorted({re.escape(word[0]) for word in words})) + '])'
+
+# D&D ability score references in text -> ETF, keyed case-folded
+ABILITY_MAP = {
+    'str': 'FIT',
+    'dex': 'FIT',
+    'con': 'FIT',
+    'int': 'INS',
+    'wis': 'INS',
+    'cha': 'WIL',
+    'strength': 'Fitness',
+    'dexterity': 'Fitness',
+    'constitution': 'Fitness',
+    'intelligence': 'Insight',
+    'wisdom': 'Insight',
+    'charisma': 'Willpower',
+}
+
+# D&D terminology -> ETF ("CR X" is handled separately as it becomes "Level X")
+TERM_MAP = {
+    'actions': 'Moments',
+    'opportunity attacks': 'reactions',
+    'half the damage': 'half as much damage',
+}
+
+# Ability references and terminology in a single scan, generated from the
+# maps above. "DC 13 STR save" needs no rule of its own: the ability
+# alternative already rewrites it to "DC 13 FIT save".
+REFERENCE_RE = re.compile(
+    first_letter_gate(['CR', *TERM_MAP, *ABILITY_MAP])
+    + r'\b(?:(?P<cr>CR\s+)'
+    + r'|(?P<term>' + '|'.join(map(re.escape, TERM_MAP)) + r')\b'
+    + r'|(?P<ability>' + '|'.join(map(re.escape, ABILITY_MAP)) + r')\b)',
+    re.IGNORECASE
+)
+
+# CR prefix, weapon attack and damage patterns
+CR_PREFIX_RE = re.compile(r'^CR\s*', re.IGNORECASE)
+# A weapon attack and the first "Hit:" damage clause within 500 chars after it
+WEAPON_HIT_RE = re.compile(
+    r'((?:Melee|Ranged)\s+Weapon\s+Attack[\s\S]{0,500}?)'
+    r'Hit:\s*\d+\s*\(\d+d\d+(?:\s*[+\-]\s*\d+)?\)\s*([^.]+?)?\s*damage(?:\s+plus\s+\d+\s*\(\d+d\d+(?:\s*[+\-]\s*\d+)?\)\s*([^.]+?)?\s*damage)?',
+    re.IGNORECASE
+)
+HIT_PLUS_DAMAGE_RE = re.compile(
+    r'Hit:\s*\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage\s+plus\s+\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage',
+    re.IGNORECASE
+)
+HIT_DAMAGE_RE = re.compile(r'Hit:\s*\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage', re.IGNORECASE)
+PAREN_DAMAGE_RE = re.compile(r'\(\s*(\d+d\d+(?:\s*[+\-]\s*\d+)?)\s*\)\s*([^.]+?)?\s*damage', re.IGNORECASE)
+
+# Highest CR of each ETF level from 1 to 9; anything above is level 10
+CR_LEVEL_BOUNDS = (1, 3, 5, 7, 9, 11, 13, 15, 17)
 
 def parse_cr_value(cr_text: str) -> float:
     """Parse CR value from text like 'CR 0', 'CR 1/8', 'CR 1/4', 'CR 1/2', 'CR 5'"""
@@ -19,7 +126,7 @@ def parse_cr_value(cr_text: str) -> float:
         return 0.0
     
     # Remove 'CR' prefix
-    cr_text = re.sub(r'^CR\s*', '', cr_text.strip(), flags=re.IGNORECASE)
+    cr_text = CR_PREFIX_RE.sub('', cr_text.strip())
     
     # Handle fractions
     if '/' in cr_text:
@@ -40,30 +147,13 @@ def parse_cr_value(cr_text: str) -> float:
 
 def cr_to_level(cr: float) -> int:
     """Convert CR to ETF level (same as JavaScript function)"""
-    if cr <= 0:
-        return 1
-    if cr <= 1:
-        return 1
-    if cr <= 3:
-        return 2
-    if cr <= 5:
-        return 3
-    if cr <= 7:
-        return 4
-    if cr <= 9:
-        return 5
-    if cr <= 11:
-        return 6
-    if cr <= 13:
-        return 7
-    if cr <= 15:
-        return 8
-    if cr <= 17:
-        return 9
-    return 10
+    return bisect_left(CR_LEVEL_BOUNDS, cr) + 1
 
 def convert_to_hit_to_defense_save_dc(text: str) -> str:
     """Convert attack rolls to Defense Save DC: +X to hit -> Defense Save DC (11+X)"""
+    if 'to hit' not in text:
+        return text
+    
     def replace_attack(match):
         to_hit_str = match.group(1)
         try:
@@ -73,24 +163,30 @@ def convert_to_hit_to_defense_save_dc(text: str) -> str:
         except:
             return match.group(0)
     
-    # Pattern: "Melee Weapon Attack: +X to hit" or "+X to hit"
-    text = re.sub(r'Melee Weapon Attack:\s*\+(\d+)\s+to hit', replace_attack, text)
-    text = re.sub(r'Ranged Weapon Attack:\s*\+(\d+)\s+to hit', replace_attack, text)
-    text = re.sub(r'\+(\d+)\s+to hit', replace_attack, text)
-    
-    return text
+    return TO_HIT_RE.sub(replace_attack, text)
 
-def convert_hp(hp_text: str) -> int:
+def convert_hp_value(hp: int) -> int:
     """Convert HP: HP/10, round up (e.g., 85 -> 9, 9 -> 1)"""
-    # Extract number from text like "Hit Points 85" or "85"
-    match = re.search(r'(\d+)', hp_text)
+    if hp < len(HP_LOOKUP):
+        return HP_LOOKUP[hp]
+    return (hp + 9) // 10
+
+def convert_hp(hp_text: str) -> int:
+    """Convert HP from unparsed text like "Hit Points 85" or "85" """
+    match = DIGITS_RE.search(hp_text)
     if match:
-        hp = int(match.group(1))
-        # Round up: divide by 10, round up
-        converted = (hp + 9) // 10  # This rounds up
-        return max(1, converted)  # Minimum 1
+        return convert_hp_value(int(match.group(1)))
     return 1
 
+def convert_hp_labels(root) -> None:
+    """Replace the number after each <strong>Hit Points</strong> label under an lxml element, in place"""
+    for strong in root.iter('strong'):
+        if strong.attrib or len(strong) or (strong.text or '').casefold() != 'hit points':
+            continue
+        match = HP_VALUE_RE.match(strong.tail or '')
+        if match:
+            strong.tail = f' {convert_hp_value(int(match.group(1)))}' + strong.tail[match.end():]
+
 def convert_weapon_damage(text: str) -> str:
     """
     Convert weapon attack damage to ETF format.
@@ -102,81 +198,20 @@ def convert_weapon_damage(text: str) -> str:
     This function identifies weapon attacks by looking for "Melee Weapon Attack" 
     or "Ranged Weapon Attack" patterns and converts their damage to "1 hit".
     """
-    def replace_weapon_hit_single(match):
-        """Replace single weapon damage"""
-        damage_type = match.group(1).strip() if match.lastindex >= 1 and match.group(1) else ''
-        if damage_type:
-            return f"Hit: 1 hit of {damage_type} damage"
-        return "Hit: 1 hit of damage"
-    
-    def replace_weapon_hit_plus(match):
-        """Replace weapon damage with plus"""
-        first_type = match.group(1).strip() if match.lastindex >= 1 and match.group(1) else ''
-        second_type = match.group(2).strip() if match.lastindex >= 2 and match.group(2) else ''
-        if first_type and second_type:
-            return f"Hit: 1 hit of {first_type} damage plus 1 hit of {second_type} damage"
-        elif first_type:
-            return f"Hit: 1 hit of {first_type} damage plus 1 hit of damage"
-        elif second_type:
-            return f"Hit: 1 hit of damage plus 1 hit of {second_type} damage"
-        return "Hit: 1 hit of damage plus 1 hit of damage"
-    
-    # Strategy: Find all "Hit:" patterns that appear after a weapon attack
-    # We'll process the text by finding weapon attack sections and converting their damage
-    
-    # Split text into chunks around weapon attacks
-    # Find all positions where weapon attacks occur
-    weapon_positions = []
-    for match in re.finditer(r'(Melee|Ranged)\s+Weapon\s+Attack', text, re.IGNORECASE):
-        weapon_positions.append(match.start())
-    
-    if not weapon_positions:
-        # No weapon attacks found, return as-is
+    # The pattern is case-insensitive, so test the case-folded text
+    if 'weapon' not in text.casefold():
         return text
     
-    # Process each weapon attack section
-    result_parts = []
-    last_pos = 0
+    def replace_weapon_hit(match):
+        """Keep the attack text and replace its damage with 1 hit per damage type"""
+        preamble, first_type, second_type = match.groups()
+        first = f"1 hit of {first_type.strip()} damage" if first_type and first_type.strip() else "1 hit of damage"
+        if 'plus' not in match.group(0)[len(preamble):].lower():
+            return f"{preamble}Hit: {first}"
+        second = f"1 hit of {second_type.strip()} damage" if second_type and second_type.strip() else "1 hit of damage"
+        return f"{preamble}Hit: {first} plus {second}"
     
-    for weapon_pos in weapon_positions:
-        # Add text before this weapon attack
-        result_parts.append(text[last_pos:weapon_pos])
-        
-        # Find the "Hit:" pattern after this weapon attack (within 500 chars)
-        section_end = min(weapon_pos + 500, len(text))
-        section = text[weapon_pos:section_end]
-        
-        # Find "Hit:" damage in this section
-        hit_match = re.search(
-            r'Hit:\s*\d+\s*\(\d+d\d+(?:\s*[+\-]\s*\d+)?\)\s*([^.]+?)?\s*damage(?:\s+plus\s+\d+\s*\(\d+d\d+(?:\s*[+\-]\s*\d+)?\)\s*([^.]+?)?\s*damage)?',
-            section,
-            re.IGNORECASE
-        )
-        
-        if hit_match:
-            # Replace the damage part
-            hit_start = weapon_pos + hit_match.start()
-            hit_end = weapon_pos + hit_match.end()
-            
-            # Get the damage replacement
-            if 'plus' in hit_match.group(0).lower():
-                replacement = replace_weapon_hit_plus(hit_match)
-            else:
-                replacement = replace_weapon_hit_single(hit_match)
-            
-            # Add text up to the hit, then replacement, then continue
-            result_parts.append(text[weapon_pos:hit_start])
-            result_parts.append(replacement)
-            last_pos = hit_end
-        else:
-            # No hit found in this section, just add the section
-            result_parts.append(section)
-            last_pos = section_end
-    
-    # Add remaining text
-    result_parts.append(text[last_pos:])
-    
-    return ''.join(result_parts)
+    return WEAPON_HIT_RE.sub(replace_weapon_hit, text)
 
 def convert_damage_to_hits(text: str) -> str:
     """
@@ -197,19 +232,22 @@ def convert_damage_to_hits(text: str) -> str:
     - "Hit: 6 (1d6 + 3) bludgeoning damage plus 9 (2d8) piercing damage" 
       -> "Hit: 2 hits of bludgeoning damage plus 3 hits of piercing damage"
     """
+    # Every pattern below (and in convert_weapon_damage) ends in "damage"
+    if 'damage' not in text.casefold():
+        return text
+    
     # First, convert weapon damage (weapons always deal 1 hit)
     text = convert_weapon_damage(text)
     
     def calculate_hits(dice_expr: str, bonus: int = 0) -> int:
         """Calculate hits from dice expression and optional bonus"""
-        # Parse dice (e.g., "2d10", "3d4", "1d8")
-        dice_match = re.match(r'(\d+)d(\d+)', dice_expr.strip())
-        if not dice_match:
+        # Parse dice (e.g., "2d10", "3d4", "1d8"); the damage patterns only
+        # let digits through on either side, but also "D" as they ignore case
+        num_text, d, size_text = dice_expr.strip().partition('d')
+        if not d:
             return 1
         
-        num_dice = int(dice_match.group(1))
-        die_size = int(dice_match.group(2))
-        max_dice = num_dice * die_size
+        max_dice = int(num_text) * int(size_text)
         
         # Divide by 6, round to nearest
         dice_hits = round(max_dice / 6)
@@ -224,16 +262,18 @@ def convert_damage_to_hits(text: str) -> str:
     
     def convert_single_damage_expr(dice_expr: str, damage_type: str = '') -> str:
         """Convert a single damage expression to hits format"""
-        bonus_match = re.search(r'([+\-])\s*(\d+)', dice_expr)
+        # The damage patterns allow at most one "+ B" or "- B" after the dice;
+        # only a positive bonus adds hits
         bonus = 0
-        if bonus_match:
-            sign = bonus_match.group(1)
-            bonus_val = int(bonus_match.group(2))
-            dice_expr = re.sub(r'\s*[+\-]\s*\d+', '', dice_expr)
-            if sign == '+':
-                bonus = bonus_val
+        for sign in '+-':
+            dice_part, found, bonus_part = dice_expr.partition(sign)
+            if found:
+                dice_expr = dice_part
+                if sign == '+':
+                    bonus = int(bonus_part)
+                break
         
-        hits = calculate_hits(dice_expr, bonus if bonus > 0 else 0)
+        hits = calculate_hits(dice_expr, bonus)
         hit_text = f"{hits} hit{'s' if hits != 1 else ''}"
         
         if damage_type:
@@ -256,12 +296,7 @@ def convert_damage_to_hits(text: str) -> str:
         return f"Hit: {first_converted} plus {second_converted}"
     
     # Match "Hit: X (YdZ) type damage plus A (BdC) other_type damage"
-    text = re.sub(
-        r'Hit:\s*\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage\s+plus\s+\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage',
-        replace_hit_with_plus,
-        text,
-        flags=re.IGNORECASE
-    )
+    text = HIT_PLUS_DAMAGE_RE.sub(replace_hit_with_plus, text)
     
     # Pattern 2: "Hit: X (YdZ + B) damage_type damage" (single damage)
     def replace_hit_damage(match):
@@ -270,12 +305,7 @@ def convert_damage_to_hits(text: str) -> str:
         converted = convert_single_damage_expr(dice_expr, damage_type)
         return f"Hit: {converted}"
     
-    text = re.sub(
-        r'Hit:\s*\d+\s*\((\d+d\d+(?:\s*[+\-]\s*\d+)?)\)\s*([^.]+?)?\s*damage',
-        replace_hit_damage,
-        text,
-        flags=re.IGNORECASE
-    )
+    text = HIT_DAMAGE_RE.sub(replace_hit_damage, text)
     
     # Pattern 3: Just dice in parentheses, like "2 (1d4) damage" (without "Hit:")
     def replace_damage_in_parens(match):
@@ -284,12 +314,7 @@ def convert_damage_to_hits(text: str) -> str:
         converted = convert_single_damage_expr(dice_expr, damage_type)
         return f"({converted})"
     
-    text = re.sub(
-        r'\(\s*(\d+d\d+(?:\s*[+\-]\s*\d+)?)\s*\)\s*([^.]+?)?\s*damage',
-        replace_damage_in_parens,
-        text,
-        flags=re.IGNORECASE
-    )
+    text = PAREN_DAMAGE_RE.sub(replace_damage_in_parens, text)
     
     return text
 
@@ -301,61 +326,77 @@ def score_to_modifier(score: int) -> int:
     """Convert ability score to modifier: modifier = floor((score - 10) / 2)"""
     return (score - 10) // 2
 
-def convert_ability_scores_table(html: str) -> str:
-    """Convert D&D ability scores table to ETF 3-column table"""
-    soup = BeautifulSoup(html, 'html.parser')
-    
+def parse_modifier(text: str) -> int:
+    """Parse an ability modifier cell (handle +0, -4, etc.)"""
+    text = text.strip()
+    if not text:
+        return 0
+    if text.startswith('+'):
+        return int(text[1:]) if text[1:] else 0
+    elif text.startswith('-'):
+        return int(text) if text != '-' else 0
+    else:
+        return int(text) if text else 0
+
+def format_modifier(mod: int) -> str:
+    """Format a modifier with an explicit sign (+2, +0, -1)"""
+    if mod >= 0:
+        return f'+{mod}'
+    return str(mod)
+
+# Rows of an ETF ability table, copied into each converted table; only the
+# modifier texts of the data row change per monster
+ETF_ABILITY_HEADER_ROW = lxml.html.fragment_fromstring(
+    '<tr>' + ''.join(f'<th class="has-text-align-center" data-align="center">{ability}</th>' for ability in ('FIT', 'INS', 'WIL')) + '</tr>'
+)
+ETF_ABILITY_DATA_ROW = lxml.html.fragment_fromstring(
+    '<tr>' + '<td class="has-text-align-center" data-align="center"></td>' * 3 + '</tr>'
+)
+
+def convert_ability_scores_table(root) -> None:
+    """Convert D&D ability scores tables under an lxml element to ETF 3-column tables, in place"""
     # Find all ability score tables
-    tables = soup.find_all('figure', class_='monster-ability-scores')
-    
-    for table_figure in tables:
-        table = table_figure.find('table')
-        if not table:
+    for table_figure in ABILITY_TABLE_XPATH(root):
+        table = table_figure.find('.//table')
+        if table is None:
             continue
         
-        thead = table.find('thead')
-        tbody = table.find('tbody')
+        thead = table.find('.//thead')
+        tbody = table.find('.//tbody')
         
-        if not thead or not tbody:
+        if thead is None or tbody is None:
             continue
         
         # Get header row
-        header_row = thead.find('tr')
-        if not header_row:
+        header_row = thead.find('.//tr')
+        if header_row is None:
             continue
         
         # Get data row
-        data_row = tbody.find('tr')
-        if not data_row:
+        data_row = tbody.find('.//tr')
+        if data_row is None:
             continue
         
         # Extract modifiers from original table
-        headers = [th.get_text().strip() for th in header_row.find_all('th')]
-        cells = [td.get_text().strip() for td in data_row.find_all('td')]
+        headers = [th.text_content().strip() for th in header_row.iter('th')]
+        cells = [td.text_content().strip() for td in data_row.iter('td')]
         
-        # Find indices for each ability
-        str_idx = next((i for i, h in enumerate(headers) if h.upper() == 'STR'), None)
-        dex_idx = next((i for i, h in enumerate(headers) if h.upper() == 'DEX'), None)
-        con_idx = next((i for i, h in enumerate(headers) if h.upper() == 'CON'), None)
-        int_idx = next((i for i, h in enumerate(headers) if h.upper() == 'INT'), None)
-        wis_idx = next((i for i, h in enumerate(headers) if h.upper() == 'WIS'), None)
-        cha_idx = next((i for i, h in enumerate(headers) if h.upper() == 'CHA'), None)
+        # Find indices for each ability in one pass (first occurrence wins)
+        idx = {}
+        for i, h in enumerate(headers):
+            idx.setdefault(h.upper(), i)
         
-        if None in [str_idx, dex_idx, con_idx, int_idx, wis_idx, cha_idx]:
+        if not all(k in idx for k in ('STR', 'DEX', 'CON', 'INT', 'WIS', 'CHA')):
             continue
         
-        # Parse modifiers (handle +0, -4, etc.)
-        def parse_modifier(text: str) -> int:
-            text = text.strip()
-            if not text:
-                return 0
-            if text.startswith('+'):
-                return int(text[1:]) if text[1:] else 0
-            elif text.startswith('-'):
-                return int(text) if text != '-' else 0
-            else:
-                return int(text) if text else 0
+        str_idx = idx['STR']
+        dex_idx = idx['DEX']
+        con_idx = idx['CON']
+        int_idx = idx['INT']
+        wis_idx = idx['WIS']
+        cha_idx = idx['CHA']
         
+        # Parse modifiers
         str_mod = parse_modifier(cells[str_idx])
         dex_mod = parse_modifier(cells[dex_idx])
         con_mod = parse_modifier(cells[con_idx])
@@ -381,137 +422,96 @@ def convert_ability_scores_table(html: str) -> str:
         insight_mod = score_to_modifier(insight_score)
         willpower_mod = score_to_modifier(willpower_score)
         
-        # Format modifiers
-        def format_modifier(mod: int) -> str:
-            if mod >= 0:
-                return f'+{mod}'
-            return str(mod)
-        
-        # Clear and rebuild header row
-        header_row.clear()
-        for ability in ['FIT', 'INS', 'WIL']:
-            th = soup.new_tag('th')
-            th['class'] = 'has-text-align-center'
-            th['data-align'] = 'center'
-            th.string = ability
-            header_row.append(th)
+        # Swap in the ETF rows (children only, the rows keep their attributes)
+        del header_row[:]
+        header_row.text = None
+        header_row.extend(copy.deepcopy(ETF_ABILITY_HEADER_ROW))
         
-        # Clear and rebuild data row
-        data_row.clear()
-        for mod in [fitness_mod, insight_mod, willpower_mod]:
-            td = soup.new_tag('td')
-            td['class'] = 'has-text-align-center'
-            td['data-align'] = 'center'
-            td.string = f'\n          {format_modifier(mod)}\n        '
-            data_row.append(td)
-    
-    return str(soup)
-
-def convert_ability_scores(text: str) -> str:
-    """Convert D&D ability scores references in text to ETF"""
-    # First convert the table
-    text = convert_ability_scores_table(text)
-    
-    # Then convert text references
-    replacements = {
-        r'\bSTR\b': 'FIT',
-        r'\bDEX\b': 'FIT',
-        r'\bCON\b': 'FIT',
-        r'\bINT\b': 'INS',
-        r'\bWIS\b': 'INS',
-        r'\bCHA\b': 'WIL',
-        r'\bStrength\b': 'Fitness',
-        r'\bDexterity\b': 'Fitness',
-        r'\bConstitution\b': 'Fitness',
-        r'\bIntelligence\b': 'Insight',
-        r'\bWisdom\b': 'Insight',
-        r'\bCharisma\b': 'Willpower',
-    }
-    
-    for pattern, replacement in replacements.items():
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    
-    return text
+        del data_row[:]
+        data_row.text = None
+        data_row.extend(copy.deepcopy(ETF_ABILITY_DATA_ROW))
+        for td, mod in zip(data_row, (fitness_mod, insight_mod, willpower_mod)):
+            td.text = f'\n          {format_modifier(mod)}\n        '
 
-def convert_terminology(text: str) -> str:
-    """Convert D&D terminology to ETF"""
-    replacements = {
-        r'\bCR\s+': 'Level ',
-        r'\bActions\b': 'Moments',
-        r'\bopportunity attacks\b': 'reactions',
-        r'\bhalf the damage\b': 'half as much damage',
-        r'\bDC\s+(\d+)\s+CHA\s+save\b': r'DC \1 WIL save',
-        r'\bDC\s+(\d+)\s+CON\s+save\b': r'DC \1 FIT save',
-        r'\bDC\s+(\d+)\s+DEX\s+save\b': r'DC \1 FIT save',
-        r'\bDC\s+(\d+)\s+STR\s+save\b': r'DC \1 FIT save',
-        r'\bDC\s+(\d+)\s+INT\s+save\b': r'DC \1 INS save',
-        r'\bDC\s+(\d+)\s+WIS\s+save\b': r'DC \1 INS save',
-    }
+def replace_reference(match) -> str:
+    """Dispatch a REFERENCE_RE match to its ETF replacement"""
+    if match.lastgroup == 'ability':
+        return ABILITY_MAP[match.group('ability').casefold()]
+    if match.lastgroup == 'term':
+        return TERM_MAP[match.group('term').casefold()]
+    return 'Level '
 
-    for pattern, replacement in replacements.items():
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+def convert_references(text: str) -> str:
+    """Convert ability score references and terminology in text to ETF in one
+    pass (the ability table is converted on the tree)"""
+    return REFERENCE_RE.sub(replace_reference, text)
 
-    return text
-
-def extract_monster_stat_block(article_html: str) -> Optional[Dict]:
-    """Extract monster data from an article HTML block"""
-    soup = BeautifulSoup(article_html, 'html.parser')
+@lru_cache(maxsize=8192)
+def convert_paragraph(paragraph: str) -> str:
+    """
+    Apply the text-level ETF conversions to one stat block paragraph.
     
+    Many monsters share identical attack and trait paragraphs, so the
+    results are cached. A weapon attack only affects damage in its own
+    paragraph.
+    """
+    # Convert to hit to Defense Save DC
+    paragraph = convert_to_hit_to_defense_save_dc(paragraph)
+    
+    # Convert damage to hits
+    paragraph = convert_damage_to_hits(paragraph)
+    
+    # Convert ability scores and terminology
+    return convert_references(paragraph)
+
+def extract_monster_stat_block(article) -> Optional[Dict]:
+    """Extract monster data from a parsed article element (converted in place)"""
     # Find monster name
-    name_elem = soup.find('h1', class_='title')
-    if not name_elem:
+    name_elems = TITLE_XPATH(article)
+    if not name_elems:
+        return None
+    
+    monster_name = name_elems[0].text_content().strip()
+    
+    content_divs = CONTENT_XPATH(article)
+    if not content_divs:
         return None
+    content_div = content_divs[0]
     
-    monster_name = name_elem.get_text().strip()
+    # CR/HP/AC all live in the stat block body, so collect its text once
+    # and search that instead of testing every text node in the tree
+    content_text = content_div.text_content()
     
     # Find CR
     cr = 0.0
-    cr_elem = soup.find(string=re.compile(r'CR\s+[\d/]+', re.IGNORECASE))
-    if cr_elem:
-        cr_text = cr_elem.strip()
-        cr = parse_cr_value(cr_text)
+    cr_match = CR_RE.search(content_text)
+    if cr_match:
+        cr = parse_cr_value(cr_match.group(0))
     
     # Find HP
     hp = 1
-    hp_elem = soup.find(string=re.compile(r'Hit Points\s+\d+', re.IGNORECASE))
-    if hp_elem:
-        hp_text = hp_elem.strip()
-        hp = convert_hp(hp_text)
+    hp_match = HP_RE.search(content_text)
+    if hp_match:
+        hp = convert_hp_value(int(hp_match.group(1)))
     
     # Find AC
     ac = 10
-    ac_elem = soup.find(string=re.compile(r'Armor Class\s+\d+', re.IGNORECASE))
-    if ac_elem:
-        ac_text = ac_elem.strip()
-        ac_match = re.search(r'(\d+)', ac_text)
-        if ac_match:
-            ac = int(ac_match.group(1))
+    ac_match = AC_RE.search(content_text)
+    if ac_match:
+        ac = int(ac_match.group(1))
     
     # Get full stat block HTML (original)
-    stat_block_html = str(soup.find('div', class_='post-single-content'))
+    stat_block_html = lxml.html.tostring(content_div, encoding='unicode', with_tail=False)
     
-    # Convert to ETF
-    etf_stat_block = stat_block_html
+    # Convert the ability scores table and HP on the parsed tree, then
+    # serialize once for the text-level conversions below
+    if 'monster-ability-scores' in stat_block_html:
+        convert_ability_scores_table(content_div)
+    convert_hp_labels(content_div)
+    etf_stat_block = lxml.html.tostring(content_div, encoding='unicode', with_tail=False)
     
-    # Convert to hit to Defense Save DC
-    etf_stat_block = convert_to_hit_to_defense_save_dc(etf_stat_block)
-    
-    # Convert damage to hits
-    etf_stat_block = convert_damage_to_hits(etf_stat_block)
-    
-    # Convert ability scores
-    etf_stat_block = convert_ability_scores(etf_stat_block)
-    
-    # Convert terminology
-    etf_stat_block = convert_terminology(etf_stat_block)
-    
-    # Replace HP in ETF version
-    etf_stat_block = re.sub(
-        r'<strong>Hit Points</strong>\s*(\d+)',
-        lambda m: f'<strong>Hit Points</strong> {convert_hp(m.group(1))}',
-        etf_stat_block,
-        flags=re.IGNORECASE
-    )
+    # Text-level conversions, paragraph by paragraph
+    etf_stat_block = '</p>'.join(map(convert_paragraph, etf_stat_block.split('</p>')))
     
     # Calculate default ETF level from CR
     level = cr_to_level(cr)
@@ -530,23 +530,73 @@ def parse_monster_file(filepath: Path) -> List[Dict]:
     """Parse all monsters from a single HTML file"""
     monsters = []
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    soup = BeautifulSoup(content, 'html.parser')
+    content = filepath.read_bytes()
+    tree = lxml.html.fromstring(content, parser=HTML_PARSER)
     
     # Find all monster stat blocks
-    stat_blocks = soup.find_all('div', class_='monster-stat-block')
-    
-    for stat_block in stat_blocks:
-        article = stat_block.find('article')
-        if article:
-            monster_data = extract_monster_stat_block(str(article))
+    for stat_block in STAT_BLOCK_XPATH(tree):
+        article = stat_block.find('.//article')
+        if article is not None:
+            monster_data = extract_monster_stat_block(article)
             if monster_data:
                 monsters.append(monster_data)
     
     return monsters
 
+def load_json(data: bytes):
+    """Decode UTF-8 JSON, with orjson if it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(data, pretty: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, with orjson if it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def file_digest(filepath: Path) -> str:
+    """Content hash of a file, far cheaper than parsing it"""
+    return hashlib.blake2b(filepath.read_bytes(), digest_size=16).hexdigest()
+
+def load_cached_monsters(converter_digest: str) -> Dict[str, Dict]:
+    """
+    Map file name -> {'hash': ..., 'monsters': [...]} from the previous run.
+    
+    HASHES_FILE records, in output order, each file's hash and how many
+    monsters it contributed to OUTPUT_FILE, so the previous output can be
+    sliced back into per-file results. Returns {} if either file is missing
+    or out of date.
+    """
+    if not HASHES_FILE.exists() or not OUTPUT_FILE.exists():
+        return {}
+    
+    try:
+        hashes = json.loads(HASHES_FILE.read_bytes())
+        js_content = OUTPUT_FILE.read_bytes()
+        if hashes.get('converter') != converter_digest:
+            return {}
+        if not (js_content.startswith(JS_PREFIX) and js_content.endswith(JS_SUFFIX)):
+            return {}
+        previous_monsters = load_json(js_content[len(JS_PREFIX):-len(JS_SUFFIX)])
+    except (OSError, ValueError):
+        return {}
+    
+    cached = {}
+    start = 0
+    for filename, entry in hashes.get('files', {}).items():
+        end = start + entry['count']
+        cached[filename] = {'hash': entry['hash'], 'monsters': previous_monsters[start:end]}
+        start = end
+    
+    # Output was written by something else since the hashes were recorded
+    if start != len(previous_monsters):
+        return {}
+    
+    return cached
+
 def main():
     """Parse all monster HTML files and create JSON data"""
     if not MONSTERS_DIR.exists():
@@ -561,17 +611,41 @@ def main():
     print(f"Found {len(html_files)} monster HTML files")
     print("=" * 60)
     
+    # Only re-parse files that changed since the last run (conversion
+    # changes invalidate everything, so the script itself is hashed too)
+    converter_digest = file_digest(Path(__file__))
+    cached = {} if '--force' in sys.argv[1:] else load_cached_monsters(converter_digest)
+    digests = {html_file.name: file_digest(html_file) for html_file in html_files}
+    changed_files = [f for f in html_files if cached.get(f.name, {}).get('hash') != digests[f.name]]
+    
+    # Files are independent, so parse them in parallel across all cores;
+    # map() keeps the results in file order. A single changed file (the
+    # usual incremental run) isn't worth starting worker processes for.
+    if len(changed_files) > 1:
+        chunksize = max(1, len(changed_files) // (4 * multiprocessing.cpu_count()))
+        with multiprocessing.Pool() as pool:
+            results = pool.map(parse_monster_file, changed_files, chunksize)
+    else:
+        results = [parse_monster_file(html_file) for html_file in changed_files]
+    parsed = {html_file.name: monsters for html_file, monsters in zip(changed_files, results)}
+    
+    file_entries = {}
     for html_file in html_files:
-        print(f"Parsing {html_file.name}...")
-        monsters = parse_monster_file(html_file)
-        print(f"  Found {len(monsters)} monsters")
+        if html_file.name in parsed:
+            monsters = parsed[html_file.name]
+            print(f"Parsed {html_file.name}: {len(monsters)} monsters")
+        else:
+            monsters = cached[html_file.name]['monsters']
+            print(f"Unchanged {html_file.name}: {len(monsters)} monsters")
+        file_entries[html_file.name] = {'hash': digests[html_file.name], 'count': len(monsters)}
         all_monsters.extend(monsters)
     
-    # Save to JavaScript file
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write('const monstersDataEmbedded = ')
-        json.dump(all_monsters, f, indent=2, ensure_ascii=False)
-        f.write(';\n')
+    # Save to JavaScript file (only browsers read it, so compact by default)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.writelines((JS_PREFIX, dump_json(all_monsters, pretty='--pretty' in sys.argv[1:]), JS_SUFFIX))
+    
+    # json.dump() would write the file piece by piece; encode it in one go
+    HASHES_FILE.write_bytes(json.dumps({'converter': converter_digest, 'files': file_entries}, indent=2).encode('utf-8'))
 
     print("=" * 60)
     print(f"Total monsters parsed: {len(all_monsters)}")
@@ -5,7 +5,16 @@ Visits each CR tag page, handles pagination, and saves complete stat blocks to H
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import importlib.util
+import json
+import shutil
+import threading
 import time
 import os
 from pathlib import Path
@@ -14,8 +23,43 @@ import re
 
 # Configuration
 BFRD_BASE_URL = 'https://bfrd.net'
+PARSER = 'lxml'  # C-backed, much faster than the pure-Python 'html.parser'
+# Fallback container for pages without <article> or <main>
+CONTENT_DIV_XPATH = etree.XPath(
+    "//div[re:test(@class, 'content|post|entry', 'i')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'},
+)
+# Monster pages are parsed with lxml, in the charset their Content-Type gives
+DEFAULT_ENCODING = 'utf-8'
+
+# Tag pages are only searched for links, so only build those into the tree
+LINKS_ONLY = SoupStrainer('a', href=True)
 OUTPUT_DIR = Path('foundation/monsters-bfrd')
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Brotli is only decoded if one of its packages is installed, so only ask
+# for it then
+ACCEPT_ENCODING = 'gzip, deflate, br' if any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi')) else 'gzip, deflate'
+
+def make_session():
+    """
+    Pooled, retrying session for bfrd.net (also used by test_pagination.py).
+    Keeps the connection alive instead of paying a TCP + TLS handshake per
+    page, and retries transient server errors.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+    ))
+    session.headers.update({
+        'User-Agent': 'easytabletopfantasy-monster-scraper',
+        'Accept-Encoding': ACCEPT_ENCODING,
+    })
+    return session
+
+# One session for every request
+SESSION = make_session()
 
 # CR tags to process (0, 1/8, 1/4, 1/2, 1-30)
 CR_TAGS = [
@@ -28,46 +72,158 @@ CR_TAGS = [
     'cr-21', 'cr-22', 'cr-23', 'cr-24', 'cr-25', 'cr-26', 'cr-27', 'cr-28', 'cr-29', 'cr-30'
 ]
 
+# Pagination pages known not to exist (URL -> time of the 404), kept between
+# runs so re-runs and resumes don't probe them again. Entries expire so newly
+# published pages are still found the next day.
+HTTP_CACHE_DIR = Path('foundation/.http_cache')
+NOT_FOUND_CACHE_FILE = HTTP_CACHE_DIR / 'not_found.json'
+NOT_FOUND_TTL = 24 * 60 * 60  # seconds
+
+def load_not_found_cache():
+    """Load the unexpired 404 entries from the previous runs"""
+    try:
+        entries = json.loads(NOT_FOUND_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {url: seen for url, seen in entries.items() if now - seen < NOT_FOUND_TTL}
+
+def save_not_found_cache():
+    """Persist the 404 entries for the next run"""
+    with NOT_FOUND_LOCK:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        NOT_FOUND_CACHE_FILE.write_bytes(json.dumps(NOT_FOUND, indent=2).encode('utf-8'))
+
+NOT_FOUND = load_not_found_cache()
+NOT_FOUND_LOCK = threading.Lock()  # CR tags are walked from several threads
+
+# Every extracted stat block is written to its own part file, which the CR
+# files are assembled from. The ETag / Last-Modified of its page is kept too,
+# so unchanged pages can be revalidated with a conditional GET and answered
+# with 304 and no body
+ETAG_CACHE_FILE = HTTP_CACHE_DIR / 'etags.json'
+STAT_BLOCK_CACHE_DIR = HTTP_CACHE_DIR / 'stat_blocks'
+SLUG_RE = re.compile(r'[^A-Za-z0-9]+')
+
+def stat_block_cache_path(url):
+    """Where the stat block extracted from a monster page is kept"""
+    slug = SLUG_RE.sub('-', urlparse(url).path).strip('-') or 'index'
+    return STAT_BLOCK_CACHE_DIR / f"{slug}.html"
+
+def load_etag_cache():
+    """Load the page validators recorded by the previous runs"""
+    try:
+        return json.loads(ETAG_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+def save_etag_cache():
+    """Persist the page validators for the next run"""
+    with ETAGS_LOCK:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        ETAG_CACHE_FILE.write_bytes(json.dumps(ETAGS, indent=2).encode('utf-8'))
+
+ETAGS = load_etag_cache()
+ETAGS_LOCK = threading.Lock()
+
+# CR tags, and each tag's monster pages, are fetched in parallel, but never
+# more than MAX_CONCURRENT_REQUESTS requests at once across all of them, and
+# never faster than REQUESTS_PER_SECOND overall to stay polite to bfrd.net
+MAX_CONCURRENT_CR_TAGS = 3
+MAX_CONCURRENT_REQUESTS = 8
+REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+# Set on Ctrl-C so CR tags already running stop at their next request
+# instead of finishing in the background
+STOP = threading.Event()
+# At most 2 requests per second, about what the original serial scraper's
+# 0.3-0.5 s pauses allowed
+REQUESTS_PER_SECOND = 2.0
+REQUEST_BURST = 2
+
+class TokenBucket:
+    """
+    Shared rate limiter: acquire() only waits when requests are already
+    coming in faster than the rate, so slow responses cost no extra sleep.
+    """
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Take the token now, even if that means going into debt, and
+            # sleep off the deficit outside the lock (cut short by Ctrl-C)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            STOP.wait(wait)
+
+# Taken before a request slot, so threads waiting on the rate don't hold
+# slots that requests could be using
+REQUEST_BUCKET = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
 def get_monster_links_from_page(url):
-    """Get all monster page links from a CR tag page"""
+    """
+    Get all monster page links from a CR tag page.
+    Returns (links, status_code); status_code is None if the request failed.
+    """
     monster_links = []
+    status_code = None
+    
+    if url in NOT_FOUND:
+        return monster_links, 404
     
     try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
+        REQUEST_BUCKET.acquire()
+        with REQUEST_SLOTS:
+            if STOP.is_set():
+                return monster_links, status_code
+            response = SESSION.get(url, timeout=10, allow_redirects=True)
+        status_code = response.status_code
         if response.status_code == 404:
-            # Page doesn't exist, return empty list
-            return monster_links
+            # Page doesn't exist, remember that and return empty list
+            with NOT_FOUND_LOCK:
+                NOT_FOUND[url] = time.time()
+            return monster_links, status_code
         if response.status_code not in [200, 301, 302]:
             print(f"  Warning: HTTP {response.status_code} for {url}")
             # Continue anyway, might still have content
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, PARSER, parse_only=LINKS_ONLY)
         
         # Find all links to monster pages
-        # Monster links typically have '/monsters/' in the path
+        # Monster links typically have '/monsters/' in the path; a dict
+        # drops duplicates while keeping page order
+        unique_links = {}
         for link in soup.find_all('a', href=True):
             href = link['href']
             if '/monsters/' in href and href != '/monsters/':
-                full_url = urljoin(BFRD_BASE_URL, href)
-                if full_url not in monster_links:
-                    monster_links.append(full_url)
-        
-        time.sleep(0.5)  # Be polite to the server
+                unique_links[urljoin(BFRD_BASE_URL, href)] = None
+        monster_links = list(unique_links)
         
     except Exception as e:
         print(f"  Error fetching {url}: {e}")
     
-    return monster_links
+    return monster_links, status_code
 
 def get_all_monster_links_for_cr(cr_tag):
     """Get all monster links for a CR tag, handling pagination"""
     print(f"  Fetching monster links for {cr_tag}...")
     
-    all_monster_links = []
+    # Used as an ordered set: dict keys keep insertion order
+    all_monster_links = {}
     base_url = f"{BFRD_BASE_URL}/tag/{cr_tag}/"
     page_num = 1
+    previous_page_empty = False
     
-    while True:
+    while not STOP.is_set():
         # Construct URL: base for page 1, /page/N for subsequent pages
         if page_num == 1:
             current_url = base_url
@@ -76,26 +232,24 @@ def get_all_monster_links_for_cr(cr_tag):
         
         print(f"    Page {page_num}: {current_url}")
         
-        # Check if page exists first (faster than fetching full content)
-        try:
-            test_response = requests.head(current_url, timeout=10, allow_redirects=True)
-            if test_response.status_code == 404:
-                print(f"    Page {page_num} not found (404) - done with {cr_tag}")
-                break
-        except Exception as e:
-            print(f"    Error checking page: {e}")
-            # Continue to try fetching anyway
-        
-        # Get monster links from this page
-        monster_links = get_monster_links_from_page(current_url)
+        # Get monster links from this page; its status tells whether the
+        # page exists, so there's no need to probe it separately first
+        monster_links, status_code = get_monster_links_from_page(current_url)
+        if status_code == 404:
+            print(f"    Page {page_num} not found (404) - done with {cr_tag}")
+            break
         
         # Add new links (avoid duplicates)
-        for link in monster_links:
-            if link not in all_monster_links:
-                all_monster_links.append(link)
+        all_monster_links.update(dict.fromkeys(monster_links))
         
         print(f"    Found {len(monster_links)} monsters on this page (total: {len(all_monster_links)})")
         
+        # Two empty pages in a row means we've run past the last page
+        if not monster_links and previous_page_empty:
+            print(f"    Two empty pages in a row - done with {cr_tag}")
+            break
+        previous_page_empty = not monster_links
+        
         # Move to next page
         page_num += 1
         
@@ -104,42 +258,95 @@ def get_all_monster_links_for_cr(cr_tag):
             print(f"    Reached safety limit of 100 pages - stopping")
             break
     
-    return all_monster_links
+    save_not_found_cache()
+    
+    return list(all_monster_links)
+
+def response_encoding(response):
+    """
+    Charset from the response's Content-Type, or DEFAULT_ENCODING if it names
+    none (requests would assume ISO-8859-1 for text/html then).
+    """
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        return DEFAULT_ENCODING
+    return requests.utils.get_encoding_from_headers(response.headers).lower()
 
 def extract_monster_stat_block(url):
-    """Extract the complete monster stat block from a monster page"""
+    """
+    Extract the complete monster stat block from a monster page.
+    Returns the path of the part file it was saved to, or None.
+    """
+    if STOP.is_set():
+        return None
+    
     try:
-        response = requests.get(url, timeout=10)
-        if response.status_code != 200:
-            print(f"      Error: HTTP {response.status_code}")
-            return None
+        # Revalidate pages we already have a stat block for
+        cache_path = stat_block_cache_path(url)
+        validators = ETAGS.get(url, {})
+        headers = {}
+        if cache_path.exists():
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        REQUEST_BUCKET.acquire()
+        with REQUEST_SLOTS:
+            if STOP.is_set():
+                return None
+            with SESSION.get(url, timeout=10, stream=True, headers=headers) as response:
+                if response.status_code == 304:
+                    return cache_path
+                if response.status_code != 200:
+                    print(f"      Error: HTTP {response.status_code}")
+                    return None
+                
+                # Parse straight from the decompressed stream with lxml
+                # rather than buffering a copy in response.content and
+                # wrapping it in a BeautifulSoup tree first
+                response.raw.decode_content = True
+                # A parser per page: lxml locks a parser for the whole of
+                # parse(), which here includes the download, so a shared
+                # one would fetch the pages one at a time
+                parser = lxml.html.HTMLParser(encoding=response_encoding(response))
+                root = lxml.html.parse(response.raw, parser).getroot()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
         
         # Find the main content area - typically in <article> or <main> or specific content div
         stat_block = None
         
-        # Try different selectors
-        article = soup.find('article')
-        if article:
-            stat_block = article
-        else:
-            main = soup.find('main')
-            if main:
-                stat_block = main
+        if root is not None:
+            # Try different selectors
+            article = root.find('.//article')
+            if article is not None:
+                stat_block = article
             else:
-                # Look for content div
-                content_div = soup.find('div', class_=re.compile('content|post|entry', re.I))
-                if content_div:
-                    stat_block = content_div
+                main = root.find('.//main')
+                if main is not None:
+                    stat_block = main
+                else:
+                    # Look for content div
+                    content_divs = CONTENT_DIV_XPATH(root)
+                    if content_divs:
+                        stat_block = content_divs[0]
+            
+            if stat_block is None:
+                # Fallback: get body content
+                stat_block = root.find('.//body')
         
-        if not stat_block:
-            # Fallback: get body content
-            stat_block = soup.find('body')
-        
-        if stat_block:
-            # Return the HTML of the stat block
-            return str(stat_block)
+        if stat_block is not None:
+            # Save the HTML of the stat block, and what to revalidate it with
+            # if the server gave us anything
+            STAT_BLOCK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(etree.tostring(stat_block, encoding='unicode', method='html', with_tail=False))
+            with ETAGS_LOCK:
+                if etag or last_modified:
+                    ETAGS[url] = {'etag': etag, 'last_modified': last_modified}
+                else:
+                    ETAGS.pop(url, None)
+            return cache_path
         
         return None
         
@@ -147,18 +354,14 @@ def extract_monster_stat_block(url):
         print(f"      Error fetching {url}: {e}")
         return None
 
-def create_html_file(cr_tag, monster_stat_blocks):
-    """Create an HTML file with all monster stat blocks for a CR level"""
-    filename = f"monster-{cr_tag}.html"
-    filepath = OUTPUT_DIR / filename
-    
-    # Create HTML structure
-    html_content = f"""<!DOCTYPE html>
+# Page skeleton of each CR file; format() slots are {cr}, {cr_display} and
+# {count}, the CSS braces are doubled
+HEADER_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BFRD Monsters - {cr_tag.upper()}</title>
+    <title>BFRD Monsters - {cr}</title>
     <style>
         body {{
             font-family: Arial, sans-serif;
@@ -217,29 +420,50 @@ def create_html_file(cr_tag, monster_stat_blocks):
     </style>
 </head>
 <body>
-    <h1>Black Flag Reference Document - Monsters ({cr_tag.upper()})</h1>
-    <p>This file contains all monster stat blocks scraped from BFRD for Challenge Rating {cr_tag.replace('cr-', '').replace('-', '/')}.</p>
-    <p>Total monsters: {len(monster_stat_blocks)}</p>
+    <h1>Black Flag Reference Document - Monsters ({cr})</h1>
+    <p>This file contains all monster stat blocks scraped from BFRD for Challenge Rating {cr_display}.</p>
+    <p>Total monsters: {count}</p>
     <hr>
 """
-    
-    # Add each monster stat block
-    for i, (url, stat_block_html) in enumerate(monster_stat_blocks, 1):
-        html_content += f"""
+STAT_BLOCK_START_TEMPLATE = """
     <div class="monster-stat-block">
         <div class="source-url">Monster {i} - Source: <a href="{url}" target="_blank">{url}</a></div>
-        {stat_block_html}
+        """
+STAT_BLOCK_END = """
     </div>
 """
-    
-    html_content += """
+FOOTER = """
 </body>
 </html>
 """
+
+def create_html_file(cr_tag, monster_stat_blocks):
+    """
+    Create an HTML file with all monster stat blocks for a CR level.
+    monster_stat_blocks holds (url, part file path) pairs; the stat blocks are
+    copied from disk rather than held in memory.
+    """
+    filename = f"monster-{cr_tag}.html"
+    filepath = OUTPUT_DIR / filename
+    # 'cr-1-8' -> '1/8'; every tag starts with 'cr-'
+    cr_display = cr_tag[3:].replace('-', '/')
     
-    # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Write the file piece by piece instead of building one big string
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(HEADER_TEMPLATE.format(
+            cr=cr_tag.upper(),
+            cr_display=cr_display,
+            count=len(monster_stat_blocks),
+        ))
+        
+        # Add each monster stat block
+        for i, (url, part_path) in enumerate(monster_stat_blocks, 1):
+            f.write(STAT_BLOCK_START_TEMPLATE.format(i=i, url=url))
+            with open(part_path, 'r', encoding='utf-8', newline='') as part:
+                shutil.copyfileobj(part, f)
+            f.write(STAT_BLOCK_END)
+        
+        f.write(FOOTER)
     
     print(f"  Saved {len(monster_stat_blocks)} monsters to {filepath}")
 
@@ -251,6 +475,8 @@ def process_cr_tag(cr_tag):
     
     # Get all monster links for this CR
     monster_links = get_all_monster_links_for_cr(cr_tag)
+    if STOP.is_set():
+        return
     
     if not monster_links:
         print(f"  No monsters found for {cr_tag}")
@@ -258,14 +484,23 @@ def process_cr_tag(cr_tag):
     
     print(f"  Found {len(monster_links)} total monster pages")
     
-    # Extract stat blocks
+    # Extract stat blocks to part files (fetched concurrently, collected in
+    # link order)
     monster_stat_blocks = []
-    for i, monster_url in enumerate(monster_links, 1):
-        print(f"  [{i}/{len(monster_links)}] Extracting {monster_url}...")
-        stat_block = extract_monster_stat_block(monster_url)
-        if stat_block:
-            monster_stat_blocks.append((monster_url, stat_block))
-        time.sleep(0.3)  # Be polite
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        part_paths = executor.map(extract_monster_stat_block, monster_links)
+        for i, (monster_url, part_path) in enumerate(zip(monster_links, part_paths), 1):
+            if STOP.is_set():
+                break
+            print(f"  [{i}/{len(monster_links)}] Extracted {monster_url}")
+            if part_path:
+                monster_stat_blocks.append((monster_url, part_path))
+    
+    save_etag_cache()
+    
+    # Don't overwrite the CR file with a partial one after an interrupt
+    if STOP.is_set():
+        return
     
     # Save to HTML file
     if monster_stat_blocks:
@@ -277,6 +512,8 @@ def main():
     """Main function"""
     import sys
     
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    
     # Check for command line argument to start from a specific CR
     start_from = None
     if len(sys.argv) > 1:
@@ -294,6 +531,7 @@ def main():
     if start_from:
         start_processing = False
     
+    selected_tags = []
     for cr_tag in CR_TAGS:
         # Skip until we reach the start_from tag
         if start_from and not start_processing:
@@ -302,14 +540,26 @@ def main():
             else:
                 print(f"Skipping {cr_tag}...")
                 continue
-        try:
-            process_cr_tag(cr_tag)
-        except KeyboardInterrupt:
-            print("\n\nInterrupted by user. Exiting...")
-            break
-        except Exception as e:
-            print(f"\nError processing {cr_tag}: {e}")
-            continue
+        selected_tags.append(cr_tag)
+    
+    # CR tags are independent, so process a few at once; REQUEST_SLOTS keeps
+    # the combined request count bounded
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CR_TAGS)
+    futures = {executor.submit(process_cr_tag, cr_tag): cr_tag for cr_tag in selected_tags}
+    try:
+        for future in as_completed(futures):
+            cr_tag = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"\nError processing {cr_tag}: {e}")
+    except KeyboardInterrupt:
+        print("\n\nInterrupted by user. Exiting...")
+        STOP.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        return
+    
+    executor.shutdown()
     
     print("\n" + "=" * 60)
     print("Scraping complete!")
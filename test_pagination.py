@@ -1,28 +1,28 @@
 #!/usr/bin/env python3
 """Quick test to verify pagination works"""
 
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_bfrd_monsters import make_session
 
 BFRD_BASE_URL = 'https://bfrd.net'
+PARSER = 'lxml'
 cr_tag = 'cr-0'
+SESSION = make_session()
 
 def get_monster_count_from_page(url):
     """Count monsters on a page"""
     try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
+        response = SESSION.get(url, timeout=10, allow_redirects=True)
         if response.status_code == 404:
             return 0, False
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        monster_links = []
+        soup = BeautifulSoup(response.content, PARSER)
+        monster_links = set()
         for link in soup.find_all('a', href=True):
             href = link['href']
             if '/monsters/' in href and href != '/monsters/':
-                full_url = urljoin(BFRD_BASE_URL, href)
-                if full_url not in monster_links:
-                    monster_links.append(full_url)
+                monster_links.add(urljoin(BFRD_BASE_URL, href))
         
         return len(monster_links), True
     except Exception as e:
@@ -54,7 +54,7 @@ while page_num <= 5:  # Test first 5 pages
     if count == 0:
         print(f"  No monsters found - checking if next page exists...")
         next_url = f"{base_url}page/{page_num + 1}/"
-        next_response = requests.head(next_url, timeout=10, allow_redirects=True)
+        next_response = SESSION.head(next_url, timeout=10, allow_redirects=True)
         if next_response.status_code == 404:
             print(f"  Next page is 404 - done")
             break
@@ -24,47 +24,36 @@ HTML_FILES = [
     'legal.html'
 ]
 
+# Nav bar patterns: the Gear link followed by the FAQ link, or the Gear link
+# on its own as a fallback. They're ASCII-only, so they run on the raw bytes
+# and the files never need decoding
+GEAR_BEFORE_FAQ_RE = re.compile(rb'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)(\s*<a href="[^"]*faq\.html")')
+GEAR_RE = re.compile(rb'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)')
+
 def update_nav_bar(filepath):
     """Update nav bar to include monsters.html link"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern to find the nav bar section with gear.html
-    # We want to add monsters.html after gear.html
-    pattern = r'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)(\s*<a href="[^"]*faq\.html")'
+    data = filepath.read_bytes()
     
-    # Check if monsters link already exists
-    if 'monsters.html' in content and 'Monsters</a>' in content:
+    # Check if monsters link already exists, or there's no Gear link to add
+    # it after, before paying for the regexes
+    if b'monsters.html' in data and b'Monsters</a>' in data:
         print(f"  {filepath.name}: Already has monsters link")
         return False
+    if b'gear.html' not in data:
+        print(f"  {filepath.name}: Could not find insertion point")
+        return False
     
-    # Try to add after gear.html
-    replacement = r'\1<a href="monsters.html">Monsters</a>\2'
-    new_content = re.sub(pattern, replacement, content)
-    
-    # If pattern didn't match, try alternative pattern (for files in different directories)
-    if new_content == content:
-        # Try with ../ prefix for root level files
-        pattern2 = r'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)(\s*<a href="[^"]*faq\.html")'
-        replacement2 = r'\1<a href="rules/monsters.html">Monsters</a>\2'
-        new_content = re.sub(pattern2, replacement2, content)
+    # monsters.html lives in rules/, so files outside it need the prefix
+    prefix = b'' if filepath.parent.name == 'rules' else b'rules/'
+    monsters_link = b'<a href="' + prefix + b'monsters.html">Monsters</a>'
     
-    # If still no match, try to find gear.html and add after it
-    if new_content == content:
-        # More flexible pattern
-        pattern3 = r'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)'
-        replacement3 = r'\1<a href="monsters.html">Monsters</a>'
-        new_content = re.sub(pattern3, replacement3, content)
-        
-        # Try with rules/ prefix
-        if new_content == content:
-            pattern4 = r'(<a href="[^"]*gear\.html"[^>]*>Gear</a>)'
-            replacement4 = r'\1<a href="rules/monsters.html">Monsters</a>'
-            new_content = re.sub(pattern4, replacement4, content)
+    # Add after gear.html, preferring the nav bar spot before faq.html
+    new_data, count = GEAR_BEFORE_FAQ_RE.subn(rb'\1' + monsters_link + rb'\2', data)
+    if not count:
+        new_data, count = GEAR_RE.subn(rb'\1' + monsters_link, data)
     
-    if new_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    if count:
+        filepath.write_bytes(new_data)
         print(f"  {filepath.name}: Updated")
         return True
     else: